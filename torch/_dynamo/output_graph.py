@@ -313,6 +313,9 @@ class OutputGraph:
         self.tracked_fakes_id_to_source: Dict[
             int, List[Source]
         ] = collections.defaultdict(list)
+        # Memoizes wrap_to_fake_tensor_and_record results per (source name,
+        # tensor id) so re-wrapping an already recorded input is a dict hit.
+        self.wrap_fake_cache: Dict[Tuple[str, int], torch.Tensor] = {}
         # Stores the full fqn of a param or buffer to the relevant source.
         self.param_name_to_source: Optional[Dict[str, Source]] = dict()
         self.side_effects = SideEffects()
@@ -13,7 +13,7 @@ import operator
 import re
 import sys
 import types
-from typing import List, NamedTuple, Optional, Union
+from typing import Dict, List, NamedTuple, Optional, Union
 
 from torch.utils._sympy.value_ranges import ValueRanges
 
@@ -252,6 +252,21 @@ class FrameStateSizeEntry:
     size: Optional[List[int]]
 
 
+# Cache of 0-dim CPU tensors wrapping small Python ints, mirroring CPython's
+# small-int cache.  Wrapping unspecialized ints is hot and the resulting
+# tensor is only ever used as an (immutable) example value.
+_small_int_tensor_cache: Dict[int, torch.Tensor] = {}
+
+
+def _wrap_unspec_int_to_tensor(value: int) -> torch.Tensor:
+    wrapped_value = _small_int_tensor_cache.get(value)
+    if wrapped_value is None:
+        wrapped_value = torch.tensor(value)
+        if -128 <= value <= 256:
+            _small_int_tensor_cache[value] = wrapped_value
+    return wrapped_value
+
+
 class VariableBuilder:
     """Wrap a python value in a VariableTracker() instance"""
 
@@ -1376,6 +1391,8 @@ class VariableBuilder:
                 self.tx.output.tracked_fakes.append(
                     TrackedFake(wrapped_value, self.source, None)
                 )
+            elif type(value) is int:
+                wrapped_value = _wrap_unspec_int_to_tensor(value)
             else:
                 wrapped_value = torch.tensor(value)
             if not isinstance(self.get_source(), RandomValueSource):
@@ -1433,17 +1450,40 @@ def _dataclasses_fields_lambda(obj):
         value = obj.user_cls
     else:
         unimplemented(f"Dataclass fields handling fails for type {obj}")
-    items = []
-    for field in dataclasses.fields(value):
-        source = None
-        if obj.source:
-            source = GetItemSource(
-                AttrSource(obj.source, "__dataclass_fields__"), field.name
+    if obj.source:
+        base_source = AttrSource(obj.source, "__dataclass_fields__")
+        items = [
+            UserDefinedObjectVariable(
+                field, source=GetItemSource(base_source, field.name)
             )
-        items.append(UserDefinedObjectVariable(field, source=source))
+            for field in dataclasses.fields(value)
+        ]
+    else:
+        items = [
+            UserDefinedObjectVariable(field, source=None)
+            for field in dataclasses.fields(value)
+        ]
     return TupleVariable(items)
 
 
+def _clone_input(value, fake_mode):
+    if isinstance(value, torch.Tensor):
+        # tensor subclasses will not be converted to FakeTensors and need to be cloned
+        if not (
+            isinstance(value, FakeTensor)
+            or (
+                # Is functional tensor fakeified by this instance of Dynamo
+                torch._is_functional_tensor(value)
+                and maybe_get_fake_mode(value) is fake_mode
+            )
+            or value.is_nested
+        ):
+            # NB: ensure strides are preserved
+            value = clone_input(value)
+
+    return value
+
+
 def wrap_fx_proxy(
     tx, proxy, example_value=None, subclass_type=None, **options
 ) -> VariableTracker:
@@ -1519,24 +1559,6 @@ def wrap_fx_proxy_cls(
 
     initial_example_value = example_value
 
-    def _clone_input(value):
-        if isinstance(value, torch.Tensor):
-            # tensor subclasses will not be converted to FakeTensors and need to be cloned
-            if not (
-                isinstance(value, FakeTensor)
-                or (
-                    # Is functional tensor fakeified by this instance of Dynamo
-                    torch._is_functional_tensor(value)
-                    and maybe_get_fake_mode(value) is tx.fake_mode
-                )
-                or value.is_nested
-            ):
-                # NB: ensure strides are preserved
-                value = clone_input(value)
-
-        return value
-
-    # with preserve_rng_state():
     if example_value is None:
         # only allow_non_graph_fake in this instance because we handle the non-fake
         # cases properly below.
@@ -1552,7 +1574,9 @@ def wrap_fx_proxy_cls(
             # to perform a clone WITHOUT preserving the subclass.  It's
             # not entirely clear this is what you actually want though.
             with torch._C.DisableTorchFunctionSubclass():
-                proxy.tracer.real_value_cache[proxy.node] = _clone_input(example_value)
+                proxy.tracer.real_value_cache[proxy.node] = _clone_input(
+                    example_value, tx.fake_mode
+                )
         # NB: If we're ignoring subclass, then the expectation is you will
         # take the returned TensorVariable and wrap it into a more
         # accurate TensorVariable that is able to track subclass-ness;
@@ -1571,13 +1595,17 @@ def wrap_fx_proxy_cls(
             f"wrapped by this instance of Dynamo. Found: {example_value}"
         )
 
-    if isinstance(example_value, torch.Tensor):
+    # Exact-type fast paths for the common cases below; isinstance on
+    # torch.Tensor walks the MRO and this function runs once per FX node.
+    example_type = type(example_value)
+
+    if example_type is FakeTensor or isinstance(example_value, torch.Tensor):
         is_parameter = isinstance(example_value, torch.nn.Parameter)
 
         # NB: In most (all?) cases, this does not actually do a clone.
         # (WARNING: this means that if we mutate metadata on the fake
         # tensor, the stored example value will update too!)
-        example_value = _clone_input(example_value)
+        example_value = _clone_input(example_value, tx.fake_mode)
         set_example_value(proxy.node, example_value)
         specialized_props = target_cls.specialize(example_value)
         # TODO: not sure about this fake mode test
@@ -1609,8 +1637,14 @@ def wrap_fx_proxy_cls(
     ):
         sizes = [ConstantVariable.create(x) for x in example_value]
         return SizeVariable(sizes, **options)
-    elif isinstance(example_value, (tuple, list)):
+    elif example_type in (tuple, list) or isinstance(example_value, (tuple, list)):
         set_example_value(proxy.node, example_value)
+        # Hoist loop invariants; this loop is hot for ops returning long
+        # tuples of tensors (e.g. chunk/unbind/MoE routing).
+        create_proxy = proxy.tracer.create_proxy
+        getitem = operator.getitem
+        has_source = "source" in options
+        source = options.get("source")
         unpacked = []
         for i, val in enumerate(example_value):
             if val is None:
@@ -1619,15 +1653,14 @@ def wrap_fx_proxy_cls(
                     ConstantVariable.create(None, **options),
                 )
             else:
-                proxy_i = proxy.tracer.create_proxy(
+                proxy_i = create_proxy(
                     kind="call_function",
-                    target=operator.getitem,
+                    target=getitem,
                     args=(proxy, i),
                     kwargs={},
                 )
 
-                if "source" in options:
-                    source = options["source"]
+                if has_source:
                     options_i = options.copy()
                     options_i["source"] = GetItemSource(
                         base=source, index=i, index_is_slice=False
@@ -1987,6 +2020,14 @@ def wrap_to_fake_tensor_and_record(
         or is_traceable_wrapper_subclass(e)
     ):
         assert source is not None
+        # Re-wrapping the same tensor under the same source (e.g. when a
+        # subgraph is retraced) repeats fakeification and re-records the
+        # same tracked fake; serve those from the per-OutputGraph memo.
+        cache_key = (source.name(), id(e))
+        if parent_context is None:
+            cached_fake = tx.output.wrap_fake_cache.get(cache_key)
+            if cached_fake is not None:
+                return cached_fake
         static_shapes, reason = tensor_always_has_static_shape(
             e, is_tensor, guard_source=source.guard_source()
         )
@@ -2050,6 +2091,8 @@ def wrap_to_fake_tensor_and_record(
             )
             tx.output.tracked_fakes_id_to_source[id(e)].append(source)
 
+        if parent_context is None:
+            tx.output.wrap_fake_cache[cache_key] = fake_e
         return fake_e
     else:
         return e
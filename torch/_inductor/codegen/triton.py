@@ -2095,9 +2095,16 @@ class TritonKernel(Kernel):
                 "Bucketize only supports indexing with int32 and int64"
             )
 
+        # For small, statically-known offset tables a branch-free linear count
+        # beats the dependent loads of binary search.
+        if isinstance(offsets_size, sympy.Integer) and int(offsets_size) <= 32:
+            helper = "bucketize_linear_search"
+        else:
+            helper = "bucketize_binary_search"
+
         result = self.cse.generate(
             self.compute,
-            f"triton_helpers.bucketize_binary_search({values}, {offsets_ptr}, {triton_dtype}, {right}, {offsets_size_str}, {block_size})",  # noqa: B950 line too long
+            f"triton_helpers.{helper}({values}, {offsets_ptr}, {triton_dtype}, {right}, {offsets_size_str}, {block_size})",  # noqa: B950 line too long
         )
 
         return result
@@ -2269,8 +2276,14 @@ class TritonKernel(Kernel):
                 self.body.writeline(
                     f"{accumulator_m2} = tl.zeros({self.dense_size_str()}, {acc_type})"
                 )
+                # The weight is an element count; for welford_reduce we
+                # generate it ourselves, so carry it as int32 to shrink the
+                # reduction tuple (welford_combine gets it from its inputs).
+                weight_acc_type = (
+                    "tl.int32" if reduction_type == "welford_reduce" else acc_type
+                )
                 self.body.writeline(
-                    f"{accumulator_weight} = tl.zeros({self.dense_size_str()}, {acc_type})"
+                    f"{accumulator_weight} = tl.zeros({self.dense_size_str()}, {weight_acc_type})"
                 )
 
                 if reduction_type == "welford_combine":
@@ -27,10 +27,18 @@ else:
     math = tl
 
 
-@triton.jit
-def promote_to_tensor(x):
-    # Addition promotes to tensor for us
-    return x + tl.zeros((1,), tl.int1)
+if hasattr(tl, "to_tensor"):
+
+    @triton.jit
+    def promote_to_tensor(x):
+        return tl.to_tensor(x)
+
+else:
+
+    @triton.jit
+    def promote_to_tensor(x):
+        # Addition promotes to tensor for us
+        return x + tl.zeros((1,), tl.int1)
 
 
 @triton.jit
@@ -51,7 +59,7 @@ def prod(input, axis):
 @triton.jit
 def minimum(a, b):
     mask = a < b
-    if is_floating(a):
+    if a.dtype.is_floating():
         mask |= a != a
     return tl.where(mask, a, b)
 
@@ -59,7 +67,7 @@ def minimum(a, b):
 @triton.jit
 def maximum(a, b):
     mask = a > b
-    if is_floating(a):
+    if a.dtype.is_floating():
         mask |= a != a
     return tl.where(mask, a, b)
 
@@ -78,7 +86,7 @@ def max2(a, dim):
 def minimum_with_index(a_value, a_index, b_value, b_index):
     mask = a_value < b_value
     equal = a_value == b_value
-    if is_floating(a_value):
+    if a_value.dtype.is_floating():
         a_isnan = a_value != a_value
         b_isnan = b_value != b_value
         mask |= a_isnan and not b_isnan
@@ -94,7 +102,7 @@ def minimum_with_index(a_value, a_index, b_value, b_index):
 def maximum_with_index(a_value, a_index, b_value, b_index):
     mask = a_value > b_value
     equal = a_value == b_value
-    if is_floating(a_value):
+    if a_value.dtype.is_floating():
         a_isnan = a_value != a_value
         b_isnan = b_value != b_value
         mask |= a_isnan and not b_isnan
@@ -134,10 +142,14 @@ def welford_reduce(value, mean, m2, weight, first_iteration):
 def welford_combine(mean_1, m2_1, weight_1, mean_2, m2_2, weight_2):
     delta = mean_2 - mean_1
     new_weight = weight_1 + weight_2
-    w2_over_w = tl.where(new_weight == 0.0, 0.0, weight_2 / new_weight)
+    # weight may be carried as an integer count to halve the accumulator
+    # width; do the blending arithmetic in the value dtype
+    w2_over_w = tl.where(
+        new_weight == 0, 0.0, weight_2.to(mean_1.dtype) / new_weight.to(mean_1.dtype)
+    )
     return (
         mean_1 + delta * w2_over_w,
-        m2_1 + m2_2 + delta * delta * weight_1 * w2_over_w,
+        m2_1 + m2_2 + delta * delta * weight_1.to(mean_1.dtype) * w2_over_w,
         new_weight,
     )
 
@@ -193,15 +205,18 @@ def bucketize_binary_search(
 
     full_range = OFFSETS_SIZE + 1
     while full_range > 1:
-        mid = (high + low) // 2
-        mask = mid < OFFSETS_SIZE
-        bucket_upper_bound = tl.load(offsets_ptr + mid, mask=mask)
+        # mid can only reach OFFSETS_SIZE for lanes that have already
+        # converged with low == high == OFFSETS_SIZE; clamping keeps the load
+        # in bounds for those lanes without changing their result, and avoids
+        # a masked (predicated) load on every iteration.
+        mid = tl.minimum((high + low) // 2, OFFSETS_SIZE - 1)
+        bucket_upper_bound = tl.load(offsets_ptr + mid)
         if right:
             is_above = values >= bucket_upper_bound
         else:
             is_above = values > bucket_upper_bound
 
-        low = tl.where(is_above & mask, mid + 1, low)
+        low = tl.where(is_above, mid + 1, low)
         high = tl.where(is_above, high, mid)
 
         full_range = (full_range + 1) // 2
@@ -209,6 +224,33 @@ def bucketize_binary_search(
     return low
 
 
+@triton.jit
+def bucketize_linear_search(
+    values,  # 1D tensor
+    offsets_ptr,
+    indexing_dtype,
+    right,  # bool: if true, use intervals closed on the left; see [Note: Inductor bucketize op]
+    OFFSETS_SIZE: tl.constexpr,
+    BLOCK_SHAPE,  # tuple/list of block shape
+):
+    """
+    See [Note: Inductor bucketize op]
+
+    For small, statically-sized offset tables a branch-free linear count is
+    faster than binary search: the dependent loads of the search are replaced
+    by OFFSETS_SIZE independent scalar loads (unrolled at compile time) and
+    the bucket index is the number of boundaries below each value.
+    """
+    low = tl.zeros(BLOCK_SHAPE, dtype=indexing_dtype)
+    for i in tl.static_range(0, OFFSETS_SIZE):
+        bucket_upper_bound = tl.load(offsets_ptr + i)
+        if right:
+            low += (values >= bucket_upper_bound).to(indexing_dtype)
+        else:
+            low += (values > bucket_upper_bound).to(indexing_dtype)
+    return low
+
+
 @triton.jit
 def pack_value_flag(
     value,
@@ -274,7 +316,7 @@ def exclusive_scan_decoupled_lookback(
         DTYPE_PACK,
     )
     if index > 0:
-        tl.atomic_xchg(scratch_base + index, pack, sem="relaxed")
+        tl.atomic_xchg(scratch_base + index, pack, sem="release")
 
     # Calculate exclusive prefix scan
     exclusive_prefix = tl.zeros([], DTYPE_VALUE)
@@ -282,9 +324,19 @@ def exclusive_scan_decoupled_lookback(
     test_target = index - 1
     while test_target >= 0:
         # tl.atomic_load
-        flag = tl.full([], 0, DTYPE_VALUE_AS_UINT)
+        # Probe once up front so already-published tiles skip the backoff
+        # path, then poll with a capped exponential backoff between probes.
+        # A tight polling loop hammers L2 and delays the producer's publish
+        # (cf. CUB's decoupled-lookback tuning).
+        pack = tl.atomic_add(scratch_base + test_target, 0, sem="acquire")
+        flag = unpack_flag(pack, DTYPE_VALUE_AS_UINT)
+        delay = tl.full([], 1, tl.int32)
         while flag == 0:
-            pack = tl.atomic_add(scratch_base + test_target, 0, sem="relaxed")
+            spin = delay
+            while spin > 0:
+                spin = spin - 1
+            delay = tl.minimum(delay * 2, 64)
+            pack = tl.atomic_add(scratch_base + test_target, 0, sem="acquire")
             flag = unpack_flag(pack, DTYPE_VALUE_AS_UINT)
 
         value = unpack_value(pack, DTYPE_VALUE, DTYPE_VALUE_AS_UINT)
@@ -310,7 +362,7 @@ def exclusive_scan_decoupled_lookback(
         DTYPE_VALUE_AS_UINT,
         DTYPE_PACK,
     )
-    tl.atomic_xchg(scratch_base + index, pack, sem="relaxed")
+    tl.atomic_xchg(scratch_base + index, pack, sem="release")
     return exclusive_prefix
 
 
@@ -330,8 +382,9 @@ def exclusive_scan_decoupled_lookback_64(scratch_base, block_value, index, combi
     if index > 0:
         block_value_u64 = block_value.to(tl.uint64, bitcast=True)
         tl.store(scratch_base + 3 * index + 1, block_value_u64)
-        tl.debug_barrier()
         flag_one = tl.full([], 1, tl.uint64)
+        # The release-ordered flag publish orders the value store above; no
+        # separate barrier is needed.
         tl.atomic_xchg(scratch_base + 3 * index + 0, flag_one, sem="release")
 
     # Calculate exclusive prefix scan
@@ -339,8 +392,16 @@ def exclusive_scan_decoupled_lookback_64(scratch_base, block_value, index, combi
     prefix_valid = False
     test_target = index - 1
     while test_target >= 0:
-        flag = tl.full([], 0, tl.uint64)
+        # Probe once up front so already-published tiles skip the backoff
+        # path, then poll with a capped exponential backoff between probes
+        # (cf. CUB's decoupled-lookback tuning).
+        flag = tl.atomic_add(scratch_base + 3 * test_target + 0, 0, sem="acquire")
+        delay = tl.full([], 1, tl.int32)
         while flag == 0:
+            spin = delay
+            while spin > 0:
+                spin = spin - 1
+            delay = tl.minimum(delay * 2, 64)
             flag = tl.atomic_add(scratch_base + 3 * test_target + 0, 0, sem="acquire")
 
         value_u64 = tl.load(scratch_base + 3 * test_target + flag.to(tl.int32))
@@ -363,8 +424,9 @@ def exclusive_scan_decoupled_lookback_64(scratch_base, block_value, index, combi
         inclusive_prefix = block_value
     inclusive_prefix_u64 = inclusive_prefix.to(tl.uint64, bitcast=True)
     tl.store(scratch_base + 3 * index + 2, inclusive_prefix_u64)
-    tl.debug_barrier()
     flag_two = tl.full([], 2, tl.uint64)
+    # The release-ordered flag publish orders the value store above; no
+    # separate barrier is needed.
     tl.atomic_xchg(scratch_base + 3 * index + 0, flag_two, sem="release")
 
     return exclusive_prefix
@@ -372,8 +434,30 @@ def exclusive_scan_decoupled_lookback_64(scratch_base, block_value, index, combi
 
 @triton.jit
 def frexp(x):
-    # TODO(isuruf): use inline_asm_elementwise here
-    y = libdevice.ilogb(x) + 1
-    exponent = tl.where(x == 0, 0, y)
-    mantissa = tl.where(x == 0, 0, libdevice.ldexp(x, -y))
+    if x.dtype == tl.float32:
+        # Extract the exponent and mantissa directly from the bit pattern
+        # instead of going through two libdevice calls (ilogb + ldexp).
+        # Plain integer ops are used rather than inline PTX so the helper
+        # works on every backend.
+        bits = x.to(tl.uint32, bitcast=True)
+        exp_bits = (bits >> 23) & 0xFF
+        # Subnormals have a zero exponent field; scaling by 2**24 (exact)
+        # renormalizes them so the same bit extraction applies.
+        scaled_bits = (x * 16777216.0).to(tl.uint32, bitcast=True)
+        is_subnormal = exp_bits == 0
+        norm_bits = tl.where(is_subnormal, scaled_bits, bits)
+        exponent = ((norm_bits >> 23) & 0xFF).to(tl.int32) - tl.where(
+            is_subnormal, 150, 126
+        )
+        mantissa_bits = (norm_bits & 0x807FFFFF) | 0x3F000000
+        mantissa = mantissa_bits.to(tl.float32, bitcast=True)
+        # Zeros renormalize to zero above; inf/nan propagate unchanged
+        is_special = (x == 0) | (exp_bits == 0xFF)
+        exponent = tl.where(is_special, 0, exponent)
+        mantissa = tl.where(x == 0, 0, tl.where(exp_bits == 0xFF, x, mantissa))
+    else:
+        # TODO(isuruf): use inline_asm_elementwise here
+        y = libdevice.ilogb(x) + 1
+        exponent = tl.where(x == 0, 0, y)
+        mantissa = tl.where(x == 0, 0, libdevice.ldexp(x, -y))
     return mantissa, exponent
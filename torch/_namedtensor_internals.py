@@ -18,9 +18,9 @@ def check_serializing_named_tensor(tensor):
 def build_dim_map(tensor):
     """Returns a map of { dim: dim_name } where dim is a name if the dim is named
     and the dim index otherwise."""
-    return OrderedDict(
-        [(idx if name is None else name, name) for idx, name in enumerate(tensor.names)]
-    )
+    return {
+        idx if name is None else name: name for idx, name in enumerate(tensor.names)
+    }
 
 
 def unzip_namedshape(namedshape):
@@ -42,20 +42,25 @@ def namer_api_name(inplace):
         return "rename"
 
 
+_ELLIPSIS_SENTINELS = (Ellipsis, "...")
+
+
 def is_ellipsis(item):
-    return item == Ellipsis or item == "..."
+    return item in _ELLIPSIS_SENTINELS
 
 
 def single_ellipsis_index(names, fn_name):
-    ellipsis_indices = [i for i, name in enumerate(names) if is_ellipsis(name)]
-    if len(ellipsis_indices) >= 2:
-        raise RuntimeError(
-            f"{fn_name}: More than one Ellipsis ('...') found in names ("
-            f"{names}). This function supports up to one Ellipsis."
-        )
-    if len(ellipsis_indices) == 1:
-        return ellipsis_indices[0]
-    return None
+    # Single pass, no list allocation; the common case has no ellipsis.
+    ellipsis_idx = None
+    for i, name in enumerate(names):
+        if is_ellipsis(name):
+            if ellipsis_idx is not None:
+                raise RuntimeError(
+                    f"{fn_name}: More than one Ellipsis ('...') found in names ("
+                    f"{names}). This function supports up to one Ellipsis."
+                )
+            ellipsis_idx = i
+    return ellipsis_idx
 
 
 def expand_single_ellipsis(numel_pre_glob, numel_post_glob, names):
@@ -90,17 +95,20 @@ def update_names_with_list(tensor, names, inplace):
 
 
 def update_names_with_mapping(tensor, rename_map, inplace):
-    dim_map = build_dim_map(tensor)
-    for old_dim in rename_map.keys():
-        new_dim = rename_map[old_dim]
-        if old_dim in dim_map.keys():
-            dim_map[old_dim] = new_dim
+    # rename_map keys are always dim names (kwargs), so unnamed dims can
+    # never match; index named dims directly instead of building the full
+    # identity dim map.
+    names = list(tensor.names)
+    index_of = {name: idx for idx, name in enumerate(names) if name is not None}
+    for old_dim, new_dim in rename_map.items():
+        if old_dim in index_of:
+            names[index_of[old_dim]] = new_dim
         else:
             raise RuntimeError(
                 f"{namer_api_name(inplace)}: Tried to rename dim '{old_dim}' to dim "
                 f"{new_dim} in Tensor[{tensor.names}] but dim '{old_dim}' does not exist"
             )
-    return tensor._update_names(tuple(dim_map.values()), inplace)
+    return tensor._update_names(tuple(names), inplace)
 
 
 def update_names(tensor, names, rename_map, inplace):
@@ -254,11 +254,12 @@ class FakeTensorConverter:
         tid = self.meta_converter.describer.lookup_tensor.get(t)
         if tid is None:
             return None
-        return self.tensor_memo.get(tid)
+        ref = self.tensor_memo.get(tid)
+        return ref if ref is None else ref()
 
     def set_tensor_memo(self, t, v):
         tid = self.meta_converter.describer.get_tensor_id(t)
-        self.meta_converter.tensor_memo[tid] = v
+        self.meta_converter._set_tensor_memo(tid, v)
 
     # You can have a real tensor that you need to convert into a fake tensor.
     # If you have a meta tensor already, call from_meta_and_device.
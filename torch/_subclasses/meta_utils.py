@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import warnings
 import weakref
 
@@ -52,6 +53,20 @@ if TYPE_CHECKING:
 
 DimList = List
 
+# nullcontext() is stateless and reentrant, so one shared instance avoids an
+# allocation at every use in the hot conversion paths below.
+_NULL_CTX: ContextManager[None] = contextlib.nullcontext()
+
+
+def _null_ctx():
+    return _NULL_CTX
+
+
+# torch.nn is not importable while this module is (we are pulled in during
+# torch's own import), so the Parameter class is cached on first use; reading
+# one module global per call beats the torch.nn.Parameter attribute chain.
+_Parameter: Optional[Type] = None
+
 
 def safe_is_leaf(t):
     try:
@@ -62,6 +77,11 @@ def safe_is_leaf(t):
 
 
 def safe_grad(t):
+    # The warning this suppresses only fires when reading .grad of a non-leaf
+    # tensor that requires grad; anywhere else, skip catch_warnings, which
+    # snapshots and restores the global filter list on every use.
+    if not t.requires_grad or safe_is_leaf(t):
+        return t.grad
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", "The .grad attribute of a Tensor")
         return t.grad
@@ -71,6 +91,12 @@ def assert_eq(a, b):
     assert a == b, f"{a} != {b}"
 
 
+# Checking metadata after conversion recursively walks grad/_base and issues
+# around ten dispatched property reads per tensor, which is pure overhead on
+# the fakeification hot path; only do it when explicitly requested.
+_CHECK_META_METADATA = os.environ.get("TORCH_META_CHECK", "0") == "1"
+
+
 def assert_metadata_eq(
     assert_eq,
     m1: Union[MetaTensorDesc, torch.Tensor],
@@ -183,10 +209,14 @@ class MetaTensorDescriber:
         )
 
     def describe_tensor(self, t: torch.Tensor, recurse: bool = True):
+        # Each of these reads is a separate pybind11/dispatcher round-trip,
+        # so read each property exactly once here and reuse the locals below.
         is_leaf = safe_is_leaf(t)
         is_view = t._is_view()
         is_sparse = t.is_sparse
         layout = t.layout
+        is_sparse_compressed_v = is_sparse_compressed_layout(layout)
+        is_sparse_any_v = is_sparse or is_sparse_compressed_v
         is_nested = t.is_nested
         is_traceable_wrapper_subclass_v = is_traceable_wrapper_subclass(t)
         is_functorch_wrapped = is_functorch_wrapped_tensor(t)
@@ -204,7 +234,7 @@ class MetaTensorDescriber:
         storage_offset = 0
         if not (
             is_sparse
-            or is_sparse_compressed_layout(layout)
+            or is_sparse_compressed_v
             or (is_nested and not is_traceable_wrapper_subclass_v)
             or is_mkldnn
             # TODO: TBH, functorch wrapped tensors probably should have
@@ -220,7 +250,7 @@ class MetaTensorDescriber:
         stride = None
         if not (
             is_sparse
-            or is_sparse_compressed_layout(layout)
+            or is_sparse_compressed_v
             or (is_nested and not is_traceable_wrapper_subclass_v)
         ):
             # stride/storage_offset are called from is_functorch_wrapped,
@@ -239,7 +269,7 @@ class MetaTensorDescriber:
         # xla and lazy tensors present as functional tensors, but we want them
         # to be handled specially
         elif is_functional and t.device.type not in ("xla", "lazy"):
-            if t._is_view():
+            if is_view:
                 raise RuntimeError(
                     "Cannot safely fakify a view because this process drops the view information right now."
                 )
@@ -272,6 +302,10 @@ class MetaTensorDescriber:
             attrs = {attr: self.describe_tensor(getattr(t, attr)) for attr in raw_attrs}
             type_v = type(t)
 
+        is_csr_or_bsr = layout in (torch.sparse_csr, torch.sparse_bsr)
+        is_csc_or_bsc = layout in (torch.sparse_csc, torch.sparse_bsc)
+        grad = safe_grad(t)
+
         # TODO: Is it important to enable torch.inference_mode before querying
         # these values?
         return MetaTensorDesc(
@@ -306,34 +340,30 @@ class MetaTensorDescriber:
             stride=stride,
             storage_offset=storage_offset,
             dynamo_dynamic_indices=list(getattr(t, "_dynamo_dynamic_indices", set())),
-            sparse_dim=t.sparse_dim()
-            if t.is_sparse or is_sparse_compressed(t)
-            else None,
-            dense_dim=t.dense_dim() if t.is_sparse or is_sparse_compressed(t) else None,
-            is_coalesced=t.is_coalesced() if t.is_sparse else None,
+            sparse_dim=t.sparse_dim() if is_sparse_any_v else None,
+            dense_dim=t.dense_dim() if is_sparse_any_v else None,
+            is_coalesced=t.is_coalesced() if is_sparse else None,
             # TODO: I actually think recursing here is correct, but we have at
             # least an infinite cycle from base -> values -> base
             # https://github.com/pytorch/pytorch/issues/122089
             crow_indices=self.describe_tensor(t.crow_indices(), recurse=False)
-            if recurse and t.layout in {torch.sparse_csr, torch.sparse_bsr}
+            if recurse and is_csr_or_bsr
             else None,
             col_indices=self.describe_tensor(t.col_indices(), recurse=False)
-            if recurse and t.layout in {torch.sparse_csr, torch.sparse_bsr}
+            if recurse and is_csr_or_bsr
             else None,
             ccol_indices=self.describe_tensor(t.ccol_indices(), recurse=False)
-            if recurse and t.layout in {torch.sparse_csc, torch.sparse_bsc}
+            if recurse and is_csc_or_bsc
             else None,
             row_indices=self.describe_tensor(t.row_indices(), recurse=False)
-            if recurse and t.layout in {torch.sparse_csc, torch.sparse_bsc}
+            if recurse and is_csc_or_bsc
             else None,
             values=self.describe_tensor(t.values(), recurse=False)
-            if recurse and is_sparse_compressed(t)
-            else None,
-            grad=self.describe_tensor(safe_grad(t))
-            if safe_grad(t) is not None
+            if recurse and is_sparse_compressed_v
             else None,
+            grad=self.describe_tensor(grad) if grad is not None else None,
             creation_meta=torch._C._autograd._get_creation_meta(t)
-            if t._is_view()
+            if is_view
             else None,
             unwrapped=unwrapped,
             level=maybe_get_level(t)
@@ -341,7 +371,7 @@ class MetaTensorDescriber:
             else None,
             bdim=maybe_get_bdim(t) if is_batchedtensor_v else None,
             base=self.describe_tensor(t._base)
-            if recurse and t._is_view() and t._base is not None
+            if recurse and is_view and t._base is not None
             else None,
             fake_mode=torch._subclasses.fake_tensor.maybe_get_fake_mode(t),
             view_func=t._view_func_unsafe,
@@ -457,26 +487,55 @@ class MetaTensorDesc:
 # meta storages. This class will hold weak references to cached tenosrs
 # and tensor storages.
 class MetaConverter:
+    __slots__ = (
+        "storage_memo",
+        "tensor_memo",
+        "hit",
+        "miss",
+        "del_hook",
+        "arg_cnt",
+        "describer",
+        "_self_ref",
+        "__weakref__",
+    )
+
     def __init__(self):
         # Maps MetaStorageId to UntypedStorage
         self.storage_memo: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
-        # Maps MetaTensorId to torch.Tensor (typically a meta tensor or
-        # FakeTensor)
-        self.tensor_memo: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # Maps MetaTensorId to a weakref of torch.Tensor (typically a meta
+        # tensor or FakeTensor).  This is a plain dict with manual weakrefs
+        # rather than a WeakValueDictionary so a memo hit is a single
+        # C-level dict probe on an int instead of a Python-level method
+        # call; the weakref callback evicts the entry on tensor death.
+        self.tensor_memo: Dict[MetaTensorId, weakref.ReferenceType] = {}
         self.hit = 0
         self.miss = 0
         self.del_hook = None
         self.arg_cnt = 0
         self.describer = MetaTensorDescriber()
+        # Shared by every tensor_memo eviction callback; one weakref for the
+        # lifetime of the converter instead of one per memoized tensor.
+        self._self_ref = weakref.ref(self)
 
     def successful(self):
         return self.hit > 0 and self.miss == 0
 
     def get_tensor_memo(self, t: MetaTensorDesc):
-        return self.tensor_memo.get(t.id, None)
+        ref = self.tensor_memo.get(t.id)
+        return ref if ref is None else ref()
+
+    def _set_tensor_memo(self, tid: MetaTensorId, v):
+        self_ref = self._self_ref
+
+        def del_ten(_):
+            self_ = self_ref()
+            if self_ is not None:
+                self_.tensor_memo.pop(tid, None)
+
+        self.tensor_memo[tid] = weakref.ref(v, del_ten)
 
     def set_tensor_memo(self, t: MetaTensorDesc, v):
-        self.tensor_memo[t.id] = v
+        self._set_tensor_memo(t.id, v)
 
     def get_storage_memo(self, s: MetaStorageDesc):
         return self.storage_memo.get(s.id, None)
@@ -508,14 +567,6 @@ class MetaConverter:
         source: Optional[Source] = None,
         symbolic_context: Optional[SymbolicContext] = None,
     ):
-        if source is None:
-            from torch._dynamo.source import ConstantSource
-
-            # TODO: make a dedicated UnknownSource for this?
-            source = ConstantSource(
-                f"__meta_utils_unknown_tensor{len(self.tensor_memo)}"
-            )
-
         # This indicates you set no_dispatch() before calling into this
         # function.  This is an error: we may be creating fake tensors and
         # will perform operations on them which need fake tensor mode to
@@ -526,6 +577,26 @@ class MetaConverter:
         arg_cnt = self.arg_cnt
         self.arg_cnt += 1
 
+        # Memo hit fast path: everything below, notably the helper closures,
+        # is only needed when we actually construct a tensor.  The memo check
+        # at the bottom is still load-bearing, as recursive meta_tensor calls
+        # from the body may have converted t themselves.
+        memo = self.get_tensor_memo(t)
+        if memo is not None:
+            return memo
+
+        # One import instead of the five previously scattered through the
+        # helpers below; each function-local ``from ... import`` re-probes
+        # sys.modules on every call, and this sits in the fakeification
+        # hot loop.
+        from torch._dynamo.source import AttrSource, ConstantSource, EphemeralSource
+
+        if source is None:
+            # TODO: make a dedicated UnknownSource for this?
+            source = ConstantSource(
+                f"__meta_utils_unknown_tensor{len(self.tensor_memo)}"
+            )
+
         # When we make as_strided calls, we end up generating a guard
         # that the new as_strided tensor is in bounds for the old storage
         # for the base (since as_strided calls can "bust" out of their
@@ -550,7 +621,7 @@ class MetaConverter:
         # This is too aggressive: we do duck sizing and 0/1 simplification
         # as we allocate variables, and we do need to register guards for
         # these cases.
-        maybe_suppress: Callable[[], Any] = contextlib.nullcontext
+        maybe_suppress: Callable[[], Any] = _null_ctx
         if shape_env is not None:
             maybe_suppress = shape_env.suppress_guards
 
@@ -613,7 +684,6 @@ class MetaConverter:
             callback=callback,
             source=source,
         ):
-            from torch._dynamo.source import AttrSource
             from torch.fx.experimental.symbolic_shapes import SubclassSymbolicContext
 
             assert t.attrs is not None
@@ -678,7 +748,6 @@ class MetaConverter:
         def all_dynamic_symbolic_context(
             t: MetaTensorDesc, source, shape_env, callback
         ):
-            from torch._dynamo.source import AttrSource
             from torch.fx.experimental.symbolic_shapes import (
                 DimDynamic,
                 StatelessSymbolicContext,
@@ -763,15 +832,14 @@ class MetaConverter:
                 # It's likely there is no view func available.
                 return base.as_strided(sizes, strides, storage_offset)
 
-            from torch._dynamo.source import EphemeralSource
             from torch.fx.experimental.symbolic_shapes import (
+                DimDynamic,
                 StatelessSymbolicContext,
                 sym_eq,
             )
 
             def symint_visitor_fn(s):
                 nonlocal symbolic_context
-                from torch.fx.experimental.symbolic_shapes import DimDynamic
 
                 all_static_sizes = (
                     symbolic_context is not None
@@ -873,7 +941,13 @@ class MetaConverter:
         if self.get_tensor_memo(t) is None:
             GRAD_TENSOR_SENTINEL_VALUE = -2
 
-            with torch.inference_mode(t.is_inference):
+            # Entering inference_mode writes dispatcher TLS on entry and
+            # exit; skip the context manager entirely when the ambient state
+            # already matches (the common, non-inference case).
+            inference_ctx: ContextManager[None] = _NULL_CTX
+            if t.is_inference != torch.is_inference_mode_enabled():
+                inference_ctx = torch.inference_mode(t.is_inference)
+            with inference_ctx:
                 if t.is_sparse:
                     is_leaf = t.is_leaf
 
@@ -1058,7 +1132,7 @@ class MetaConverter:
 
                     r = _to_fake_tensor(t)
 
-                elif t.is_functional and t.device.type not in ["xla", "lazy"]:
+                elif t.is_functional and t.device.type not in ("xla", "lazy"):
                     assert t.unwrapped is not None
                     assert not t.is_functorch_wrapped  # handled above
                     unwrapped = self.meta_tensor(
@@ -1069,7 +1143,11 @@ class MetaConverter:
                         symbolic_context=symbolic_context,
                     )
                     r = torch._to_functional_tensor(unwrapped)
-                    torch._mirror_autograd_meta_to(t.autograd_meta_from, r)  # type: ignore[attr-defined]
+                    # _mirror_autograd_meta_to only copies requires_grad (and
+                    # installs an error grad_fn when it is set), so the C++
+                    # round-trip is a no-op when neither side requires grad.
+                    if t.requires_grad or r.requires_grad:
+                        torch._mirror_autograd_meta_to(t.autograd_meta_from, r)  # type: ignore[attr-defined]
 
                 elif t.is_view:
                     # Construct views in two steps: recursively meta-fy their
@@ -1096,7 +1174,7 @@ class MetaConverter:
                         t.base,
                         shape_env,
                         callback,
-                        source=torch._dynamo.source.AttrSource(source, "_base"),
+                        source=AttrSource(source, "_base"),
                         symbolic_context=base_symbolic_context,
                     )
 
@@ -1112,12 +1190,16 @@ class MetaConverter:
                     # assert to pass, we have to setup the autograd view
                     # metadata anyway.  Do this by reenabling the
                     # ADInplaceOrView key.  This is kind of a hack.
+                    # When the key isn't excluded (the common case), both the
+                    # set and the restore below would be no-ops; skip them and
+                    # pay a single TLS query instead of three.
                     old_exclude = torch._C._dispatch_tls_is_dispatch_key_excluded(
                         torch._C.DispatchKey.ADInplaceOrView
                     )
-                    torch._C._dispatch_tls_set_dispatch_key_excluded(
-                        torch._C.DispatchKey.ADInplaceOrView, False
-                    )
+                    if old_exclude:
+                        torch._C._dispatch_tls_set_dispatch_key_excluded(
+                            torch._C.DispatchKey.ADInplaceOrView, False
+                        )
                     try:
                         if base.dtype == t.dtype:
                             pass
@@ -1181,9 +1263,10 @@ class MetaConverter:
                         assert t.creation_meta is not None
                         torch._C._autograd._set_creation_meta(r, t.creation_meta)
                     finally:
-                        torch._C._dispatch_tls_set_dispatch_key_excluded(
-                            torch._C.DispatchKey.ADInplaceOrView, old_exclude
-                        )
+                        if old_exclude:
+                            torch._C._dispatch_tls_set_dispatch_key_excluded(
+                                torch._C.DispatchKey.ADInplaceOrView, True
+                            )
 
                 else:
                     is_leaf = t.is_leaf
@@ -1197,10 +1280,12 @@ class MetaConverter:
                     # If we have a subclass that desugars into dense tensors,
                     # perform our callback on each inner tensor.
                     if t.is_traceable_wrapper_subclass:
+                        from_empty_strided = False
                         r = empty_create_subclass(
                             t, outer_size=sizes, outer_stride=strides
                         )
                     else:
+                        from_empty_strided = True
                         r = callback(
                             lambda: torch.empty_strided(
                                 sizes,
@@ -1240,8 +1325,16 @@ class MetaConverter:
                     if s.id not in self.storage_memo and (
                         r.is_nested
                         or (
-                            r.stride() == strides
-                            and r.storage_offset() == storage_offset
+                            # A fresh empty_strided output has exactly these
+                            # strides and a zero storage offset by
+                            # construction, so only the offset needs checking;
+                            # this skips two dispatched calls per dense tensor.
+                            storage_offset == 0
+                            if from_empty_strided
+                            else (
+                                r.stride() == strides
+                                and r.storage_offset() == storage_offset
+                            )
                         )
                     ):
                         # You're normal and happy, install the fresh storage into the memo
@@ -1275,7 +1368,7 @@ class MetaConverter:
                         # subclasses.  Relevant test is
                         # DynamicShapesFunctionTests::test_add_dynamic_shapes in
                         # test/dynamo/test_dynamic_shapes.py
-                        maybe_fake_mgr: ContextManager[None] = contextlib.nullcontext()
+                        maybe_fake_mgr: ContextManager[None] = _NULL_CTX
                         from torch._subclasses.fake_tensor import (
                             in_kernel_invocation_manager,
                             maybe_get_fake_mode,
@@ -1288,8 +1381,6 @@ class MetaConverter:
                             r.set_(r_s, storage_offset, sizes, strides)
 
                 if t.grad is not None:
-                    from torch._dynamo.source import AttrSource
-
                     # TODO: Use a valid grad-specific symbolic context instead of recycling
                     # the one from t. This isn't correct if e.g. t._is_view() != t.grad._is_view().
                     r.grad = self.meta_tensor(
@@ -1301,11 +1392,13 @@ class MetaConverter:
                     )
                 torch._C._set_conj(r, t.is_conj)
                 torch._C._set_neg(r, t.is_neg)
-            # This can be skipped if necessary for performance reasons
-            skip_leaf = (
-                t.is_gradtrackingtensor and t.level == GRAD_TENSOR_SENTINEL_VALUE
-            )
-            assert_metadata_eq(assert_eq, t, r, skip_symbolic=True, skip_leaf=skip_leaf)
+            if _CHECK_META_METADATA:
+                skip_leaf = (
+                    t.is_gradtrackingtensor and t.level == GRAD_TENSOR_SENTINEL_VALUE
+                )
+                assert_metadata_eq(
+                    assert_eq, t, r, skip_symbolic=True, skip_leaf=skip_leaf
+                )
             self.set_tensor_memo(t, r)
 
         return self.get_tensor_memo(t)
@@ -1357,14 +1450,22 @@ class MetaConverter:
         # Do the meta-fication.  Here, we disable all the ambient modes, to
         # better simulate what would be like to re-fakeify from a fresh
         # process
-        with contextlib.ExitStack() as exit_stack:
-            exit_stack.enter_context(torch._dispatch.python.suspend_functionalization())
-            st = peek_interpreter_stack()
-            if st is not None:
-                exit_stack.enter_context(
-                    torch._functorch.pyfunctorch.temporarily_clear_interpreter_stack()
-                )
-
+        # suspend_functionalization only does work when the Functionalize
+        # key is included in TLS; probe that bit first rather than paying
+        # for the generator-based context manager on every conversion.  The
+        # shared _NULL_CTX stand-ins also let us drop the per-call ExitStack.
+        suspend_ctx: ContextManager[None] = _NULL_CTX
+        if torch._C._dispatch_tls_is_dispatch_key_included(
+            torch._C.DispatchKey.Functionalize
+        ):
+            suspend_ctx = torch._dispatch.python.suspend_functionalization()
+        st = peek_interpreter_stack()
+        clear_ctx: ContextManager[None] = _NULL_CTX
+        if st is not None:
+            clear_ctx = (
+                torch._functorch.pyfunctorch.temporarily_clear_interpreter_stack()
+            )
+        with suspend_ctx, clear_ctx:
             r = self.meta_tensor(
                 t_desc,
                 shape_env=shape_env,
@@ -1373,7 +1474,10 @@ class MetaConverter:
                 symbolic_context=symbolic_context,
             )
 
-        if type(t) is torch.nn.Parameter:
+        global _Parameter
+        if _Parameter is None:
+            _Parameter = torch.nn.Parameter
+        if type(t) is _Parameter:
             # NB: Cannot directly use Parameter constructor
             # because that would force a detach, not desirable
             r._is_param = True
@@ -1,5 +1,5 @@
 import math
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import torch
 from torch._refs import _unsqueeze_multiple
@@ -16,11 +16,35 @@ _FLOAT_DTYPES = [torch.float8_e5m2, torch.float8_e4m3fn]
 _DTYPE_TO_QVALUE_BOUNDS = {k : (torch.iinfo(k).min, torch.iinfo(k).max) for k in _INTEGER_DTYPES}
 _DTYPE_TO_QVALUE_BOUNDS.update({k : (int(torch.finfo(k).min), int(torch.finfo(k).max)) for k in _FLOAT_DTYPES})
 
+# Plain dtypes whose full range matches a native quantized dtype, so the
+# decomposition can defer to the vectorized aten quantize kernel in eager mode
+_DTYPE_TO_QDTYPE = {
+    torch.uint8: torch.quint8,
+    torch.int8: torch.qint8,
+    torch.int32: torch.qint32,
+}
+
+# eps values come from a handful of qconfig constants, so cache the CPU
+# float32 tensors handed to determine_qparams (which only reads them) instead
+# of allocating one per choose_qparams call
+_EPS_TENSOR_CACHE: Dict[float, torch.Tensor] = {}
+
+def _get_eps_tensor(eps: float) -> torch.Tensor:
+    et = _EPS_TENSOR_CACHE.get(eps)
+    if et is None:
+        et = torch.tensor([eps], dtype=torch.float32)
+        # don't cache under tracing: a fake/functional tensor must not leak
+        # into later eager calls
+        if type(et) is torch.Tensor:
+            _EPS_TENSOR_CACHE[eps] = et
+    return et
+
 # Helper to check the passed in quant min and max are valid for the dtype
 def _quant_min_max_bounds_check(quant_min, quant_max, dtype):
-    if dtype not in _DTYPE_TO_QVALUE_BOUNDS:
+    bounds = _DTYPE_TO_QVALUE_BOUNDS.get(dtype)
+    if bounds is None:
         raise ValueError(f"Unsupported dtype: {dtype}")
-    quant_min_lower_bound, quant_max_upper_bound = _DTYPE_TO_QVALUE_BOUNDS[dtype]
+    quant_min_lower_bound, quant_max_upper_bound = bounds
 
     assert quant_min >= quant_min_lower_bound, \
         "quant_min out of bound for dtype, " \
@@ -63,6 +87,22 @@ def quantize_per_tensor(
     assert input.dtype == torch.float32, f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
     _quant_min_max_bounds_check(quant_min, quant_max, dtype)
 
+    qdtype = _DTYPE_TO_QDTYPE.get(dtype)
+    if (
+        qdtype is not None
+        and type(input) is torch.Tensor
+        and input.device.type == "cpu"
+        and not input.requires_grad
+        and (quant_min, quant_max) == _DTYPE_TO_QVALUE_BOUNDS[dtype]
+    ):
+        # The aten kernel clamps to the dtype's full range, so it only matches
+        # the decomposition when (quant_min, quant_max) span exactly that
+        # range; its CPU implementation is vectorized, unlike the four
+        # separate passes below.  The plain-tensor check keeps tracing
+        # (fake/functional tensors) on the decomposed path so captured graphs
+        # are unchanged.
+        return torch.quantize_per_tensor(input, scale, zero_point, qdtype).int_repr()
+
     inv_scale = 1.0 / scale
     return torch.clamp(torch.round(input * inv_scale) + zero_point, quant_min, quant_max).to(dtype)
 
@@ -75,9 +115,10 @@ def quantize_per_tensor_meta(
         quant_max: int,
         dtype: torch.dtype
 ) -> torch.Tensor:
-    if input.dtype in [torch.float16, torch.bfloat16]:
-        input = input.to(torch.float32)
-    assert input.dtype == torch.float32, f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
+    # the upcast in the real kernel doesn't change sizes/strides, so the meta
+    # kernel only needs the dtype check, not the intermediate allocation
+    assert input.dtype in [torch.float32, torch.float16, torch.bfloat16], \
+        f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
     return torch.empty_like(input, dtype=dtype)
 
 quantized_decomposed_lib.define(
@@ -100,7 +141,19 @@ def quantize_per_tensor_tensor(
     """
     assert zero_point.numel() == 1, f"Expecting zero_point tensor to be one element, but received : {zero_point.numel()}"
     assert scale.numel() == 1, f"Expecting scale tensor to be one element, but received : {scale.numel()}"
-    return quantize_per_tensor(input, scale.item(), zero_point.item(), quant_min, quant_max, dtype)
+    if scale.device != input.device or zero_point.device != input.device:
+        return quantize_per_tensor(input, scale.item(), zero_point.item(), quant_min, quant_max, dtype)
+    if input.dtype in [torch.float16, torch.bfloat16]:
+        input = input.to(torch.float32)
+    assert input.dtype == torch.float32, f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
+    _quant_min_max_bounds_check(quant_min, quant_max, dtype)
+
+    # broadcast scale/zero_point instead of calling .item(), which forces a
+    # device-to-host sync; the reciprocal is taken in the scale's own
+    # (typically float64) dtype and narrowed to float32 before the multiply,
+    # matching the scalar path's precision
+    inv_scale = (1.0 / scale).to(torch.float32)
+    return torch.clamp(torch.round(input * inv_scale) + zero_point, quant_min, quant_max).to(dtype)
 
 @impl(quantized_decomposed_lib, "quantize_per_tensor.tensor", "Meta")
 def quantize_per_tensor_tensor_meta(
@@ -111,11 +164,10 @@ def quantize_per_tensor_tensor_meta(
         quant_max: int,
         dtype: torch.dtype
 ) -> torch.Tensor:
-    if input.dtype in [torch.float16, torch.bfloat16]:
-        input = input.to(torch.float32)
     assert zero_point.numel() == 1, f"Expecting zero_point tensor to be one element, but received : {zero_point.numel()}"
     assert scale.numel() == 1, f"Expecting scale tensor to be one element, but received : {scale.numel()}"
-    assert input.dtype == torch.float32, f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
+    assert input.dtype in [torch.float32, torch.float16, torch.bfloat16], \
+        f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
     return torch.empty_like(input, dtype=dtype)
 
 # TODO: remove other variants and keep this one
@@ -139,7 +191,9 @@ def quantize_per_tensor_tensor2(
     """
     assert zero_point.numel() == 1, f"Expecting zero_point tensor to be one element, but received : {zero_point.numel()}"
     assert scale.numel() == 1, f"Expecting scale tensor to be one element, but received : {scale.numel()}"
-    return quantize_per_tensor(input, scale.item(), zero_point.item(), quant_min.item(), quant_max.item(), dtype)
+    # quant_min/quant_max are host-side ints for the bounds check, but
+    # scale/zero_point stay on device (see quantize_per_tensor.tensor)
+    return quantize_per_tensor_tensor(input, scale, zero_point, quant_min.item(), quant_max.item(), dtype)
 
 @impl(quantized_decomposed_lib, "quantize_per_tensor.tensor2", "Meta")
 def quantize_per_tensor_tensor2_meta(
@@ -245,7 +299,17 @@ def dequantize_per_tensor_tensor(
     """
     assert zero_point.numel() == 1, f"Expecting zero_point tensor to be one element, but received : {zero_point.numel()}"
     assert scale.numel() == 1, f"Expecting scale tensor to be one element, but received : {scale.numel()}"
-    return dequantize_per_tensor(input, scale.item(), zero_point.item(), quant_min, quant_max, dtype, out_dtype=out_dtype)
+    if scale.device != input.device or zero_point.device != input.device:
+        return dequantize_per_tensor(input, scale.item(), zero_point.item(), quant_min, quant_max, dtype, out_dtype=out_dtype)
+    assert input.dtype == dtype, f"Expecting input to have dtype: {dtype}, but got {input.dtype}"
+    if dtype not in _DTYPE_TO_QVALUE_BOUNDS:
+        raise ValueError(f"Unsupported dtype in dequantize_per_tensor: {dtype}")
+    if out_dtype is None:
+        out_dtype = torch.float32
+    # broadcast instead of .item() (device-to-host sync); narrow the typically
+    # float64 scale to out_dtype so the multiply doesn't promote the whole
+    # tensor to double as the scalar path never did
+    return (input.to(out_dtype) - zero_point) * scale.to(out_dtype)
 
 @impl(quantized_decomposed_lib, "dequantize_per_tensor.tensor", "Meta")
 def dequantize_per_tensor_tensor_meta(
@@ -291,8 +355,9 @@ def dequantize_per_tensor_tensor2(
     """
     assert zero_point.numel() == 1, f"Expecting zero_point tensor to be one element, but received : {zero_point.numel()}"
     assert scale.numel() == 1, f"Expecting scale tensor to be one element, but received : {scale.numel()}"
-    return dequantize_per_tensor(
-        input, scale.item(), zero_point.item(), quant_min.item(), quant_max.item(), dtype, out_dtype=out_dtype)
+    # scale/zero_point stay on device (see dequantize_per_tensor.tensor)
+    return dequantize_per_tensor_tensor(
+        input, scale, zero_point, quant_min.item(), quant_max.item(), dtype, out_dtype=out_dtype)
 
 @impl(quantized_decomposed_lib, "dequantize_per_tensor.tensor2", "Meta")
 def dequantize_per_tensor_tensor2_meta(
@@ -344,7 +409,7 @@ def choose_qparams_tensor(
     min_val, max_val = torch.aminmax(input)
 
     return determine_qparams(
-        min_val, max_val, qmin, qmax, dtype, torch.Tensor([eps]), has_customized_qrange=False)
+        min_val, max_val, qmin, qmax, dtype, _get_eps_tensor(eps), has_customized_qrange=False)
 
 quantized_decomposed_lib.define(
     "choose_qparams_symmetric.tensor(Tensor input, int quant_min, int quant_max, "
@@ -387,7 +452,7 @@ def choose_qparams_symmetric_tensor(
         qmin,
         qmax,
         dtype,
-        torch.Tensor([eps]),
+        _get_eps_tensor(eps),
         has_customized_qrange=False,
         qscheme=torch.per_tensor_symmetric
     )
@@ -419,14 +484,6 @@ def choose_qparams_symmetric_tensor_meta(
 ) -> Tuple[torch.Tensor, torch.Tensor]:
     return torch.empty(1, dtype=torch.double, device=input.device), torch.empty(1, dtype=torch.int64, device=input.device)
 
-# Helper function used to implement per-channel quantization against any axis
-def _permute_to_axis_zero(x, axis):
-    new_axis_list = list(range(x.dim()))
-    new_axis_list[axis] = 0
-    new_axis_list[0] = axis
-    y = x.permute(tuple(new_axis_list))
-    return y, new_axis_list
-
 quantized_decomposed_lib.define(
     "quantize_per_channel(Tensor input, Tensor scales, Tensor zero_points, int axis, "
     "int quant_min, int quant_max, ScalarType dtype) -> Tensor")
@@ -463,18 +520,17 @@ def quantize_per_channel(
     assert input.dtype == torch.float32, f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
     assert axis < input.dim(), f"Expecting axis to be < {input.dim()}"
     _quant_min_max_bounds_check(quant_min, quant_max, dtype)
-    input, permute_axis_list = _permute_to_axis_zero(input, axis)
-    res = torch.zeros_like(input)
-
-    for i in range(input.size(0)):
-        res[i] = torch.clamp(
-            torch.round(input[i] * (1.0 / scales[i])) + zero_points[i],
-            quant_min,
-            quant_max
-        )
-
-    out = res.permute(tuple(permute_axis_list))
-    return out.to(dtype)
+    broadcast_dims = list(range(0, axis)) + list(range(axis + 1, input.ndim))
+    # reciprocal of the 1-D scales, so the division happens once per channel
+    # rather than once per element
+    unsqueeze_inv_scales = _unsqueeze_multiple(scales.reciprocal(), broadcast_dims)
+    unsqueeze_zero_points = _unsqueeze_multiple(zero_points, broadcast_dims)
+
+    return torch.clamp(
+        torch.round(input * unsqueeze_inv_scales) + unsqueeze_zero_points,
+        quant_min,
+        quant_max
+    ).to(dtype)
 
 @impl(quantized_decomposed_lib, "quantize_per_channel", "Meta")
 def quantize_per_channel_meta(
@@ -486,9 +542,8 @@ def quantize_per_channel_meta(
         quant_max: int,
         dtype: torch.dtype
 ) -> torch.Tensor:
-    if input.dtype in [torch.float16, torch.bfloat16]:
-        input = input.to(torch.float32)
-    assert input.dtype == torch.float32, f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
+    assert input.dtype in [torch.float32, torch.float16, torch.bfloat16], \
+        f"Expecting input to have dtype torch.float32, but got dtype: {input.dtype}"
     assert axis < input.dim(), f"Expecting axis to be < {input.dim()}"
     _quant_min_max_bounds_check(quant_min, quant_max, dtype)
     return torch.empty_like(input, dtype=dtype)
@@ -546,18 +601,16 @@ def dequantize_per_channel(
         out_dtype = torch.float32
     assert axis < input.dim(), f"Expecting axis to be < {input.dim()}"
     _quant_min_max_bounds_check(quant_min, quant_max, dtype)
-    input, permute_axis_list = _permute_to_axis_zero(input, axis)
-    res = torch.zeros_like(input, dtype=out_dtype)
+    broadcast_dims = list(range(0, axis)) + list(range(axis + 1, input.ndim))
+    unsqueeze_scales = _unsqueeze_multiple(scales, broadcast_dims)
 
-    for i in range(input.size(0)):
-        zp = zero_points[i] if zero_points is not None else 0
-        # TODO: investigate why
-        # (input[i] - zero_points[i]).to(out_dtype) * scales[i]
-        # failed the test
-        res[i] = (input[i].to(out_dtype) - zp) * scales[i]
-
-    out = res.permute(tuple(permute_axis_list))
-    return out
+    # TODO: investigate why
+    # (input - zero_points).to(out_dtype) * scales
+    # failed the test
+    res = input.to(out_dtype)
+    if zero_points is not None:
+        res = res - _unsqueeze_multiple(zero_points, broadcast_dims)
+    return res * unsqueeze_scales
 
 @impl(quantized_decomposed_lib, "dequantize_per_channel", "Meta")
 def dequantize_per_channel_meta(
@@ -996,10 +1049,15 @@ class FakeQuantPerChannel(torch.autograd.Function):
         assert axis < input.dim(), f"Expecting axis to be < {input.dim()}"
         broadcast_dims = list(range(0, axis)) + list(range(axis + 1, input.ndim))
         unsqueeze_scales = _unsqueeze_multiple(scales, broadcast_dims)
+        unsqueeze_inv_scales = _unsqueeze_multiple(scales.reciprocal(), broadcast_dims)
         unsqueeze_zero_points = _unsqueeze_multiple(zero_points, broadcast_dims)
-        temp = torch.round(input * (1.0 / unsqueeze_scales)) + unsqueeze_zero_points
-        out = (torch.clamp(temp, quant_min, quant_max) - unsqueeze_zero_points) * unsqueeze_scales
-        mask = torch.logical_and((temp >= quant_min), (temp <= quant_max))
+        temp = torch.round(input * unsqueeze_inv_scales) + unsqueeze_zero_points
+        clamped = torch.clamp(temp, quant_min, quant_max)
+        out = (clamped - unsqueeze_zero_points) * unsqueeze_scales
+        # temp == clamped iff quant_min <= temp <= quant_max (NaN compares
+        # false either way), so one comparison against the clamp result we
+        # already have replaces the ge/le/logical_and triple
+        mask = temp == clamped
 
         ctx.save_for_backward(mask)
         return out
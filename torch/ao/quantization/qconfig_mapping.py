@@ -1,6 +1,6 @@
 from __future__ import annotations
-from collections import OrderedDict
-from typing import Any, Callable, Dict, Tuple, Union, List
+import functools
+from typing import Any, Callable, Dict, Iterable, Tuple, Union, List
 
 import torch
 
@@ -59,9 +59,13 @@ _FIXED_QPARAMS_OP_TO_OBSERVER: Dict[Union[Callable, str], _PartialWrapper] = {
 }
 
 
-def _get_default_qconfig_mapping(is_qat: bool, backend: str, version: int) -> QConfigMapping:
+@functools.lru_cache(maxsize=None)
+def _build_default_qconfig_mapping(is_qat: bool, backend: str, version: int) -> QConfigMapping:
     """
-    Return the default QConfigMapping for the given quantization type and backend.
+    Build the default QConfigMapping for the given quantization type and backend.
+
+    The result is a pure function of the arguments, so it is cached; callers
+    must not mutate it (see _get_default_qconfig_mapping).
     """
     if is_qat:
         qconfig = get_default_qat_qconfig(backend, version)
@@ -84,19 +88,22 @@ def _get_default_qconfig_mapping(is_qat: bool, backend: str, version: int) -> QC
 
     qconfig_mapping = QConfigMapping() \
         .set_global(qconfig) \
-        .set_object_type("reshape", default_reuse_input_qconfig) \
-        .set_object_type(torch.nn.ConvTranspose1d, qconfig_transpose) \
-        .set_object_type(torch.nn.ConvTranspose2d, qconfig_transpose) \
-        .set_object_type(torch.nn.ConvTranspose3d, qconfig_transpose) \
-        .set_object_type(torch.nn.functional.conv_transpose1d, qconfig_transpose) \
-        .set_object_type(torch.nn.functional.conv_transpose2d, qconfig_transpose) \
-        .set_object_type(torch.nn.functional.conv_transpose3d, qconfig_transpose) \
-        .set_object_type(torch.nn.functional.layer_norm, qconfig_layernorm) \
-        .set_object_type(torch.nn.LayerNorm, qconfig_layernorm) \
-        .set_object_type(torch.nn.PReLU, default_quint8_weight_qconfig) \
+        ._bulk_set_object_types([
+            ("reshape", default_reuse_input_qconfig),
+            (torch.nn.ConvTranspose1d, qconfig_transpose),
+            (torch.nn.ConvTranspose2d, qconfig_transpose),
+            (torch.nn.ConvTranspose3d, qconfig_transpose),
+            (torch.nn.functional.conv_transpose1d, qconfig_transpose),
+            (torch.nn.functional.conv_transpose2d, qconfig_transpose),
+            (torch.nn.functional.conv_transpose3d, qconfig_transpose),
+            (torch.nn.functional.layer_norm, qconfig_layernorm),
+            (torch.nn.LayerNorm, qconfig_layernorm),
+            (torch.nn.PReLU, default_quint8_weight_qconfig),
+        ])
 
     # Use special observers for ops with fixed qparams
     fixed_qparams_observer_to_qconfig: Dict[Any, QConfigAny] = {}
+    fixed_qparams_object_types: List[Tuple[Union[Callable, str], QConfigAny]] = []
     for fixed_qparams_op, observer in _FIXED_QPARAMS_OP_TO_OBSERVER.items():
         if observer in fixed_qparams_observer_to_qconfig:
             fixed_qparams_qconfig = fixed_qparams_observer_to_qconfig[observer]
@@ -107,13 +114,31 @@ def _get_default_qconfig_mapping(is_qat: bool, backend: str, version: int) -> QC
                 activation = observer
             fixed_qparams_qconfig = QConfig(activation=activation, weight=default_weight)
             fixed_qparams_observer_to_qconfig[observer] = fixed_qparams_qconfig
-        qconfig_mapping.set_object_type(fixed_qparams_op, fixed_qparams_qconfig)
+        fixed_qparams_object_types.append((fixed_qparams_op, fixed_qparams_qconfig))
+    qconfig_mapping._bulk_set_object_types(fixed_qparams_object_types)
 
     # TODO Currently it's required that separate ops in a fused op/module have the same qconfig.
     #      Need to be able to support fusion of ops with different qconfigs
 
     return qconfig_mapping
 
+def _get_default_qconfig_mapping(is_qat: bool, backend: str, version: int) -> QConfigMapping:
+    """
+    Return the default QConfigMapping for the given quantization type and backend.
+    """
+    cached = _build_default_qconfig_mapping(is_qat, backend, version)
+    # Hand out a fresh mapping so callers can mutate it without corrupting the
+    # cache.  The QConfigs themselves are shared module-level constants, so a
+    # shallow copy of the four maps is enough.
+    qconfig_mapping = QConfigMapping()
+    qconfig_mapping.global_qconfig = cached.global_qconfig
+    qconfig_mapping.object_type_qconfigs = cached.object_type_qconfigs.copy()
+    qconfig_mapping.module_name_regex_qconfigs = cached.module_name_regex_qconfigs.copy()
+    qconfig_mapping.module_name_qconfigs = cached.module_name_qconfigs.copy()
+    qconfig_mapping.module_name_object_type_order_qconfigs = \
+        cached.module_name_object_type_order_qconfigs.copy()
+    return qconfig_mapping
+
 def get_default_qconfig_mapping(backend="x86", version=0) -> QConfigMapping:
     """
     Return the default QConfigMapping for post training quantization.
@@ -213,11 +238,11 @@ class QConfigMapping:
     def __init__(self):
         # In increasing match priority:
         self.global_qconfig: QConfigAny = None
-        self.object_type_qconfigs: OrderedDict[Union[Callable, str], QConfigAny] = OrderedDict()
-        self.module_name_regex_qconfigs: OrderedDict[str, QConfigAny] = OrderedDict()
-        self.module_name_qconfigs: OrderedDict[str, QConfigAny] = OrderedDict()
-        self.module_name_object_type_order_qconfigs: OrderedDict[Tuple[str, Callable, int], QConfigAny] =\
-            OrderedDict()
+        # plain dicts preserve insertion order, which the regex matching relies on
+        self.object_type_qconfigs: Dict[Union[Callable, str], QConfigAny] = {}
+        self.module_name_regex_qconfigs: Dict[str, QConfigAny] = {}
+        self.module_name_qconfigs: Dict[str, QConfigAny] = {}
+        self.module_name_object_type_order_qconfigs: Dict[Tuple[str, Callable, int], QConfigAny] = {}
 
     def set_global(self, global_qconfig: QConfigAny) -> QConfigMapping:
         """
@@ -234,6 +259,16 @@ class QConfigMapping:
         self.object_type_qconfigs[object_type] = qconfig
         return self
 
+    def _bulk_set_object_types(
+            self,
+            object_type_qconfigs: Iterable[Tuple[Union[Callable, str], QConfigAny]]) -> QConfigMapping:
+        """
+        Set the QConfigs for many object types in one dict update.
+        Same semantics as calling ``set_object_type`` for each pair in order.
+        """
+        self.object_type_qconfigs.update(object_type_qconfigs)
+        return self
+
     def set_module_name_regex(self, module_name_regex: str, qconfig: QConfigAny) -> QConfigMapping:
         """
         Set the QConfig for modules matching the given regex string.
@@ -284,7 +319,7 @@ class QConfigMapping:
         for style_name in _QCONFIG_STYLE_ORDER:
             output += f"\n {style_name}"
             qconfigs = getattr(self, style_name)
-            if isinstance(qconfigs, OrderedDict) and len(qconfigs) > 0:
+            if isinstance(qconfigs, dict) and len(qconfigs) > 0:
                 for key, qconfig in qconfigs.items():
                     output += f"\n  {key}: {qconfig}"
             else:
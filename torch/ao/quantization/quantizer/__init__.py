@@ -10,12 +10,12 @@ from .quantizer import (
 )
 
 __all__ = [
+    "DerivedQuantizationSpec",
     "EdgeOrNode",
-    "Quantizer",
-    "QuantizationSpecBase",
-    "QuantizationSpec",
     "FixedQParamsQuantizationSpec",
-    "SharedQuantizationSpec",
-    "DerivedQuantizationSpec",
     "QuantizationAnnotation",
+    "QuantizationSpec",
+    "QuantizationSpecBase",
+    "Quantizer",
+    "SharedQuantizationSpec",
 ]